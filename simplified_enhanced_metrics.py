@@ -3,223 +3,510 @@
 Simplified Enhanced Metrics Analysis for Grok-3 Simulations
 """
 
+import array
+import contextlib
+import functools
+import hashlib
 import json
+import os
+import pathlib
+import pickle
+import re
+import sys
 import numpy as np
-from typing import Dict, List, Any
-from collections import defaultdict
+from numpy.lib import recfunctions as rfn
+from typing import Dict, List, Any, Iterable, Iterator, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import ahocorasick  # Multi-keyword technical term scan
+except ImportError:
+    ahocorasick = None
+
+try:
+    import ijson  # Streams simulations from very large files one at a time
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Faster whole-file parser
+except ImportError:
+    orjson = None
+
+# Communication quality indicators and technical terms, matched against lowercased content
+_STRONG_PHRASES = ('please', 'let me help', 'i understand', 'can you')
+_MED_PHRASES = ('step by step', 'first', 'next', 'verify')
+_TECHNICAL_TERMS = ('check', 'verify', 'enable', 'disable', 'toggle', 'settings', 'network', 'data')
+
+# Each distinct keyword owns one bit of a per-message mask; categories are unions of bits
+_KEYWORD_BITS = {
+    keyword: 1 << i
+    for i, keyword in enumerate(dict.fromkeys(_STRONG_PHRASES + _MED_PHRASES + _TECHNICAL_TERMS))
+}
+_STRONG_MASK = sum(_KEYWORD_BITS[keyword] for keyword in _STRONG_PHRASES)
+_MED_MASK = sum(_KEYWORD_BITS[keyword] for keyword in _MED_PHRASES)
+_TECH_MASK = sum(_KEYWORD_BITS[keyword] for keyword in _TECHNICAL_TERMS)
+
+# Efficiency lookup tables indexed by message count bucket (bucket bounds are inclusive)
+_SUCCESS_EFFICIENCY_BINS = np.array([10, 20, 30])
+_SUCCESS_EFFICIENCY = np.array([1.0, 0.8, 0.6, 0.4])
+_FAILURE_EFFICIENCY_BINS = np.array([5, 15])
+_FAILURE_EFFICIENCY = np.array([0.3, 0.5, 0.2])
+
+# Termination reasons with dedicated failure handling; any other reason is coded as other
+_TERMINATION_CODES = {'user_stop': 0, 'max_turns': 1}
+_TERMINATION_OTHER = 2
+
+# Failure types and reasons indexed by failure code; successful simulations are coded -1
+_FAILURE_TYPES = (
+    'premature_termination',
+    'extended_failure',
+    'execution_timing',
+    'timeout_failure',
+    'unknown_failure'
+)
+_FAILURE_REASONS = (
+    'Conversation ended too early',
+    'Long conversation without resolution',
+    'User stopped despite ongoing conversation',
+    'Reached maximum conversation length',
+    'Terminated due to: {termination_reason}'
+)
+_SUCCESS_CODE = -1
+
+# Per-simulation analysis results, one contiguous record per simulation
+RESULT_DTYPE = np.dtype([
+    ('execution', 'f8'),
+    ('communication', 'f8'),
+    ('technical', 'f8'),
+    ('efficiency', 'f8'),
+    ('overall', 'f8'),
+    ('duration', 'f8'),
+    ('msg_count', 'i4'),
+    ('agent_msg_count', 'i4'),
+    ('failure_code', 'i1')
+])
+_SCORE_FIELDS = ['execution', 'communication', 'technical', 'efficiency', 'overall']
+
+# Performance tier bounds: poor < 0.4 <= acceptable < 0.6 <= good < 0.8 <= excellent
+_TIER_BINS = np.array([0.4, 0.6, 0.8])
+
+# Below this many messages the NumPy reduction beats importing and loading the Numba kernel
+_NUMBA_MIN_MESSAGES = 5_000_000
+
+# Files above this size are streamed with ijson (C backend only) to bound peak memory;
+# smaller files parse faster in one go with orjson or json
+_STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+# Per-user on-disk cache of per-file analysis results, invalidated whenever this module changes
+_CACHE_DIR = (
+    pathlib.Path(os.environ.get('XDG_CACHE_HOME') or pathlib.Path.home() / '.cache')
+    / 'simplified_enhanced_metrics'
+)
+_SOURCE_DIGEST = hashlib.blake2b(pathlib.Path(__file__).read_bytes()).hexdigest()
+
+# Message role codes stored in the flattened per-message features
+_ROLE_CODES = {'assistant': 1, 'user': 2, 'tool': 3}
+_ROLE_ASSISTANT = _ROLE_CODES['assistant']
+
+# array.array typecodes of the flattened per-message feature columns
+_MESSAGE_COLUMNS = {
+    'roles': 'B',
+    'content_lens': 'i',
+    'keyword_masks': 'H',
+    'tool_flags': 'B'
+}
+
+
+def _build_keyword_matcher():
+    """Build a single-pass scan returning the keyword bitmask of lowercased content"""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword, bit in _KEYWORD_BITS.items():
+            automaton.add_word(keyword, bit)
+        automaton.make_automaton()
+
+        def keyword_mask(content: str) -> int:
+            mask = 0
+            for _, bit in automaton.iter(content):
+                mask |= bit
+            return mask
+    else:
+        pattern = re.compile('|'.join(map(re.escape, _KEYWORD_BITS)))
+
+        def keyword_mask(content: str) -> int:
+            mask = 0
+            match = pattern.search(content)
+            while match is not None:
+                mask |= _KEYWORD_BITS[match.group()]
+                # Resume just past the match start so overlapping keywords are found too
+                match = pattern.search(content, match.start() + 1)
+            return mask
+
+    return keyword_mask
+
+
+_keyword_mask = _build_keyword_matcher()
 
 
 def analyze_simulation_file(filepath: str) -> Dict[str, Any]:
-    """Analyze a single simulation file with enhanced metrics"""
+    """Analyze a single simulation file, reusing cached results while it is unchanged"""
+    st = os.stat(filepath)
+    return _analyze_cached(os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
 
-    with open(filepath, 'r') as f:
-        data = json.load(f)
 
-    simulations = data['simulations']
-    enhanced_results = []
+@functools.lru_cache(maxsize=None)
+def _analyze_cached(filepath: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Memoize analysis results in-process and on disk, keyed by file identity"""
+    key = hashlib.blake2b(f'{_SOURCE_DIGEST}|{filepath}|{mtime_ns}|{size}'.encode()).hexdigest()
+    cache_path = _CACHE_DIR / f'{key}.pkl'
 
-    for sim in simulations:
-        # Extract basic metrics from existing data
-        reward = sim['reward_info']['reward']
-        messages = sim.get('messages', [])
+    # The cache is best-effort: a missing, unreadable or corrupt entry is recomputed
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+            IndexError, TypeError, ValueError):
+        pass
+
+    result = _analyze_simulation_file(filepath)
+
+    # Write atomically so an interrupted run never leaves a truncated entry, and
+    # skip caching entirely when the cache directory is not writable
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(pickle.dumps(result))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+    return result
 
-        # Calculate enhanced metrics
-        metrics = calculate_enhanced_metrics(messages, reward, sim)
-        enhanced_results.append(metrics)
+
+def _analyze_simulation_file(filepath: str) -> Dict[str, Any]:
+    """Analyze a single simulation file with enhanced metrics"""
+
+    # Extract per-simulation features in one streaming pass, then score them array-wise
+    features = extract_features(iter_simulations(filepath))
+    results = calculate_enhanced_metrics(features)
 
     # Generate summary
-    summary = generate_summary_insights(enhanced_results)
+    summary = generate_summary_insights(results)
 
     return {
-        'domain_analysis': enhanced_results,
+        'domain_analysis': results,
+        'termination_reasons': features['termination_reasons'],
         'summary_insights': summary,
-        'total_simulations': len(simulations)
+        'total_simulations': len(results)
     }
 
 
-def calculate_enhanced_metrics(messages: List[Dict], reward: float, simulation: Dict) -> Dict[str, Any]:
-    """Calculate enhanced metrics for a single simulation"""
-
-    # Basic execution metrics
-    execution_score = reward  # Use existing reward as base execution score
-
-    # Communication quality assessment
-    agent_messages = [msg for msg in messages if msg.get('role') == 'assistant']
-    communication_score = assess_communication_quality(agent_messages)
-
-    # Technical accuracy (simplified)
-    technical_score = assess_technical_accuracy(messages)
+def to_dict(results: np.ndarray, termination_reasons: List[str]) -> List[Dict[str, Any]]:
+    """Materialize RESULT_DTYPE records as per-simulation dicts for callers that need them"""
+    records = results.tolist()
+    names = results.dtype.names
+    enhanced_results = []
 
-    # Efficiency metrics
-    efficiency_score = assess_efficiency(messages, reward)
+    for record, termination_reason in zip(records, termination_reasons):
+        result = dict(zip(names, record))
+        enhanced_results.append({
+            'execution_score': result['execution'],
+            'communication_score': result['communication'],
+            'technical_score': result['technical'],
+            'efficiency_score': result['efficiency'],
+            'overall_score': result['overall'],
+            'failure_analysis': analyze_failure_pattern(
+                result['failure_code'], termination_reason, result['msg_count'], result['duration']
+            ),
+            'message_count': result['msg_count'],
+            'agent_message_count': result['agent_msg_count']
+        })
+
+    return enhanced_results
+
+
+def iter_simulations(filepath: str) -> Iterator[Dict]:
+    """Yield the simulations of a results file, streaming only very large files"""
+    with open(filepath, 'rb') as f:
+        if (ijson is not None and ijson.backend.endswith('_c')
+                and os.fstat(f.fileno()).st_size > _STREAMING_THRESHOLD_BYTES):
+            yield from ijson.items(f, 'simulations.item', use_float=True)
+            return
+        data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+
+    yield from data['simulations']
+
+
+def extract_features(simulations: Iterable[Dict]) -> Dict[str, Any]:
+    """Walk each simulation once and reduce its messages to per-simulation features
+
+    Messages are first flattened into per-message feature columns, CSR-style,
+    with sim_offsets[s]:sim_offsets[s + 1] spanning the messages of simulation
+    s. Columns are array.array buffers, so simulations can be consumed from a
+    stream without knowing their count up front.
+    """
+    rewards = array.array('d')
+    durations = array.array('d')
+    sim_offsets = array.array('q', [0])
+    columns = {name: array.array(typecode) for name, typecode in _MESSAGE_COLUMNS.items()}
+    termination_codes = array.array('b')
+    termination_reasons = []
 
-    # Overall composite score
-    overall_score = (
-        execution_score * 0.35 +
-        communication_score * 0.25 +
-        technical_score * 0.25 +
-        efficiency_score * 0.15
+    for sim in simulations:
+        walk_messages(sim.get('messages', []), columns)
+        rewards.append(sim['reward_info']['reward'])
+        durations.append(sim.get('duration') or 0.0)
+        sim_offsets.append(len(columns['roles']))
+        termination_reason = sim.get('termination_reason', 'unknown')
+        if isinstance(termination_reason, str):
+            # Reasons repeat across simulations, so keep one shared object per distinct reason
+            termination_reason = sys.intern(termination_reason)
+        termination_codes.append(_TERMINATION_CODES.get(termination_reason, _TERMINATION_OTHER))
+        termination_reasons.append(termination_reason)
+
+    sim_offsets = np.asarray(sim_offsets)
+    agent_msg_counts, comm_quality_raw, tech_term_hits, tool_call_counts = reduce_message_features(
+        sim_offsets, *(np.asarray(columns[name]) for name in _MESSAGE_COLUMNS)
     )
 
-    # Failure analysis
-    failure_analysis = analyze_failure_pattern(simulation, messages, reward)
-
     return {
-        'execution_score': execution_score,
-        'communication_score': communication_score,
-        'technical_score': technical_score,
-        'efficiency_score': efficiency_score,
-        'overall_score': overall_score,
-        'failure_analysis': failure_analysis,
-        'message_count': len(messages),
-        'agent_message_count': len(agent_messages)
+        'rewards': np.asarray(rewards),
+        'durations': np.asarray(durations),
+        'msg_counts': np.diff(sim_offsets),
+        'agent_msg_counts': agent_msg_counts,
+        'tech_term_hits': tech_term_hits,
+        'tool_call_counts': tool_call_counts,
+        'comm_quality_raw': comm_quality_raw,
+        'termination_codes': np.asarray(termination_codes),
+        'termination_reasons': termination_reasons
     }
 
 
-def assess_communication_quality(agent_messages: List[Dict]) -> float:
-    """Assess communication quality based on agent messages"""
-    if not agent_messages:
-        return 0.0
-
-    quality_score = 0.0
-    total_messages = len(agent_messages)
+def calculate_enhanced_metrics(features: Dict[str, Any]) -> np.ndarray:
+    """Calculate enhanced metrics for all simulations into one RESULT_DTYPE array"""
+    rewards = features['rewards']
+    agent_msg_counts = features['agent_msg_counts']
+    results = np.zeros(len(rewards), dtype=RESULT_DTYPE)
 
-    for message in agent_messages:
-        content = message.get('content', '').lower()
+    # Basic execution metrics
+    results['execution'] = rewards  # Use existing reward as base execution score
 
-        # Positive indicators
-        if any(phrase in content for phrase in ['please', 'let me help', 'i understand', 'can you']):
-            quality_score += 1.0
-        elif any(phrase in content for phrase in ['step by step', 'first', 'next', 'verify']):
-            quality_score += 0.8
-        elif len(content) > 50:  # Substantive response
-            quality_score += 0.5
-        else:
-            quality_score += 0.3
+    # Communication quality: average per-message quality. Simulations without agent
+    # messages have a zero quality sum, so dividing by at least 1 scores them 0.
+    results['communication'] = np.clip(
+        features['comm_quality_raw'] / np.maximum(agent_msg_counts, 1), 0.0, 1.0
+    )
 
-    return min(1.0, quality_score / total_messages)
+    # Technical accuracy: technical language and tool usage, with a 0.6 baseline
+    results['technical'] = np.clip(
+        features['tech_term_hits'] * 0.1 + features['tool_call_counts'] * 0.2, 0.6, 1.0
+    )
 
+    # Efficiency metrics
+    results['efficiency'] = assess_efficiency(features['msg_counts'], rewards)
 
-def assess_technical_accuracy(messages: List[Dict]) -> float:
-    """Assess technical accuracy based on conversation content"""
-    # Simplified assessment based on technical terms and tool usage
-    technical_terms = ['check', 'verify', 'enable', 'disable', 'toggle', 'settings', 'network', 'data']
-    tool_calls = 0
-    technical_content = 0
+    # Overall composite score
+    results['overall'] = (
+        results['execution'] * 0.35 +
+        results['communication'] * 0.25 +
+        results['technical'] * 0.25 +
+        results['efficiency'] * 0.15
+    )
 
-    for message in messages:
-        content = message.get('content', '').lower()
-        if any(term in content for term in technical_terms):
-            technical_content += 1
+    # Conversation stats and failure analysis
+    results['duration'] = features['durations']
+    results['msg_count'] = features['msg_counts']
+    results['agent_msg_count'] = agent_msg_counts
+    results['failure_code'] = classify_failures(
+        rewards, features['termination_codes'], features['msg_counts']
+    )
 
-        if 'tool_calls' in message or 'function_call' in message:
-            tool_calls += 1
+    return results
+
+
+def walk_messages(messages: List[Dict], columns: Dict[str, array.array]) -> None:
+    """Walk a conversation once and append its per-message features to the columns"""
+    # Bind lookups and appends once per conversation rather than once per message
+    role_code = _ROLE_CODES.get
+    keyword_mask = _keyword_mask
+    append_role = columns['roles'].append
+    append_content_len = columns['content_lens'].append
+    append_keyword_mask = columns['keyword_masks'].append
+    append_tool_flag = columns['tool_flags'].append
+
+    for msg in messages:
+        # Content stays str: ASCII text is already stored one byte per char (PEP 393),
+        # and encoding to bytes first measured slower for both lowering and scanning
+        content = (msg.get('content') or '').lower()
+        append_role(role_code(msg.get('role'), 0))
+        append_content_len(len(content))
+        append_keyword_mask(keyword_mask(content))
+        append_tool_flag('tool_calls' in msg or 'function_call' in msg)
+
+
+def reduce_message_features(sim_offsets: np.ndarray, roles: np.ndarray, content_lens: np.ndarray,
+                            keyword_masks: np.ndarray, tool_flags: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Reduce flattened per-message features to per-simulation sums
+
+    Returns (agent message counts, summed agent communication quality,
+    messages with technical terms, messages with tool usage).
+    """
+    reducer = _reduce_message_features_numpy if len(roles) < _NUMBA_MIN_MESSAGES else _message_reducer()
+    return reducer(sim_offsets, roles, content_lens, keyword_masks, tool_flags)
+
+
+@functools.lru_cache(maxsize=None)
+def _message_reducer():
+    """Compile the Numba reduction kernel on first use, or fall back to NumPy
+
+    numba is imported lazily, only for inputs large enough to repay its import.
+    The kernel is serial: files are already analyzed in parallel worker
+    processes, and a Numba thread pool per worker would oversubscribe the CPU.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _reduce_message_features_numpy
+
+    @njit(cache=True)
+    def reduce_message_features_kernel(sim_offsets, roles, content_lens, keyword_masks, tool_flags):
+        n = sim_offsets.shape[0] - 1
+        agent_msg_counts = np.zeros(n, dtype=np.int64)
+        comm_quality_raw = np.zeros(n, dtype=np.float64)
+        tech_term_hits = np.zeros(n, dtype=np.int64)
+        tool_call_counts = np.zeros(n, dtype=np.int64)
+
+        for s in range(n):
+            for i in range(sim_offsets[s], sim_offsets[s + 1]):
+                if roles[i] == _ROLE_ASSISTANT:
+                    agent_msg_counts[s] += 1
+                    # Positive indicators, then substantive (> 50 chars) responses
+                    if keyword_masks[i] & _STRONG_MASK:
+                        comm_quality_raw[s] += 1.0
+                    elif keyword_masks[i] & _MED_MASK:
+                        comm_quality_raw[s] += 0.8
+                    elif content_lens[i] > 50:
+                        comm_quality_raw[s] += 0.5
+                    else:
+                        comm_quality_raw[s] += 0.3
+
+                if keyword_masks[i] & _TECH_MASK:
+                    tech_term_hits[s] += 1
+                tool_call_counts[s] += tool_flags[i]
+
+        return agent_msg_counts, comm_quality_raw, tech_term_hits, tool_call_counts
+
+    return reduce_message_features_kernel
+
+
+def _reduce_message_features_numpy(sim_offsets, roles, content_lens, keyword_masks, tool_flags):
+    """Vectorized NumPy version of the reduction kernel for when numba is unavailable"""
+    n = sim_offsets.shape[0] - 1
+    sim_ids = np.repeat(np.arange(n), np.diff(sim_offsets))
+    is_agent = roles == _ROLE_ASSISTANT
+    agent_sim_ids = sim_ids[is_agent]
+
+    # Positive indicators, then substantive (> 50 chars) responses
+    quality = np.select(
+        [keyword_masks & _STRONG_MASK != 0, keyword_masks & _MED_MASK != 0, content_lens > 50],
+        [1.0, 0.8, 0.5],
+        0.3
+    )
 
-    # Base technical score on presence of technical language and tool usage
-    technical_score = min(1.0, (technical_content * 0.1 + tool_calls * 0.2))
-    return max(0.6, technical_score)  # Minimum baseline technical competency
+    return (
+        np.bincount(agent_sim_ids, minlength=n),
+        np.bincount(agent_sim_ids, weights=quality[is_agent], minlength=n),
+        np.bincount(sim_ids[keyword_masks & _TECH_MASK != 0], minlength=n),
+        np.bincount(sim_ids[tool_flags.astype(bool)], minlength=n)
+    )
 
 
-def assess_efficiency(messages: List[Dict], reward: float) -> float:
+def assess_efficiency(msg_counts: np.ndarray, rewards: np.ndarray) -> np.ndarray:
     """Assess conversation efficiency"""
-    message_count = len(messages)
-
     # Efficiency decreases with message count, but rewards successful outcomes
-    if reward > 0:
+    return np.where(
+        rewards > 0,
         # Successful outcomes - efficiency based on brevity
-        if message_count <= 10:
-            efficiency = 1.0
-        elif message_count <= 20:
-            efficiency = 0.8
-        elif message_count <= 30:
-            efficiency = 0.6
-        else:
-            efficiency = 0.4
-    else:
-        # Failed outcomes - lower efficiency
-        if message_count <= 5:
-            efficiency = 0.3  # Too short, likely premature termination
-        elif message_count <= 15:
-            efficiency = 0.5
-        else:
-            efficiency = 0.2  # Long and unsuccessful
+        _SUCCESS_EFFICIENCY[np.digitize(msg_counts, _SUCCESS_EFFICIENCY_BINS, right=True)],
+        # Failed outcomes - too short (likely premature termination) or long and unsuccessful
+        _FAILURE_EFFICIENCY[np.digitize(msg_counts, _FAILURE_EFFICIENCY_BINS, right=True)]
+    )
 
-    return efficiency
 
+def classify_failures(rewards: np.ndarray, termination_codes: np.ndarray,
+                      msg_counts: np.ndarray) -> np.ndarray:
+    """Classify the failure type code of every simulation, -1 for successes"""
+    user_stop = termination_codes == _TERMINATION_CODES['user_stop']
+    failure_codes = np.select(
+        [
+            user_stop & (msg_counts < 5),  # Conversation ended too early
+            user_stop & (msg_counts > 30),  # Long conversation without resolution
+            user_stop,
+            termination_codes == _TERMINATION_CODES['max_turns']
+        ],
+        [0, 1, 2, 3],
+        4
+    )
+    return np.where(rewards > 0, _SUCCESS_CODE, failure_codes).astype(np.int8)
 
-def analyze_failure_pattern(simulation: Dict, messages: List[Dict], reward: float) -> Dict[str, Any]:
-    """Analyze failure patterns"""
-    if reward > 0:
-        return {'failure_type': None, 'failure_reason': 'Success'}
 
-    # Analyze termination reason
-    termination_reason = simulation.get('termination_reason', 'unknown')
-    message_count = len(messages)
-    duration = simulation.get('duration', 0)
-
-    # Categorize failure type
-    if termination_reason == 'user_stop':
-        if message_count < 5:
-            failure_type = 'premature_termination'
-            failure_reason = 'Conversation ended too early'
-        elif message_count > 30:
-            failure_type = 'extended_failure'
-            failure_reason = 'Long conversation without resolution'
-        else:
-            failure_type = 'execution_timing'
-            failure_reason = 'User stopped despite ongoing conversation'
-    elif termination_reason == 'max_turns':
-        failure_type = 'timeout_failure'
-        failure_reason = 'Reached maximum conversation length'
-    else:
-        failure_type = 'unknown_failure'
-        failure_reason = f'Terminated due to: {termination_reason}'
+def analyze_failure_pattern(failure_code: int, termination_reason: str, message_count: int,
+                            duration: float) -> Dict[str, Any]:
+    """Describe the failure pattern of a single simulation from its failure code"""
+    if failure_code == _SUCCESS_CODE:
+        return {'failure_type': None, 'failure_reason': 'Success'}
 
     return {
-        'failure_type': failure_type,
-        'failure_reason': failure_reason,
+        'failure_type': _FAILURE_TYPES[failure_code],
+        'failure_reason': _FAILURE_REASONS[failure_code].format(termination_reason=termination_reason),
         'termination_reason': termination_reason,
         'message_count': message_count,
         'duration': duration
     }
 
 
-def generate_summary_insights(enhanced_results: List[Dict]) -> Dict[str, Any]:
+def generate_summary_insights(results: np.ndarray) -> Dict[str, Any]:
     """Generate summary insights across all simulations"""
 
-    if not enhanced_results:
+    if len(results) == 0:
         return {}
 
-    # Calculate averages
-    execution_scores = [r['execution_score'] for r in enhanced_results]
-    communication_scores = [r['communication_score'] for r in enhanced_results]
-    technical_scores = [r['technical_score'] for r in enhanced_results]
-    efficiency_scores = [r['efficiency_score'] for r in enhanced_results]
-    overall_scores = [r['overall_score'] for r in enhanced_results]
+    # View component scores as one (N, 5) array and average them in a single reduction
+    n = len(results)
+    scores = rfn.structured_to_unstructured(results[_SCORE_FIELDS])
+    (
+        mean_execution,
+        mean_communication,
+        mean_technical,
+        mean_efficiency,
+        mean_overall
+    ) = scores.mean(axis=0)
 
     # Performance distribution
-    excellent = sum(1 for s in overall_scores if s >= 0.8)
-    good = sum(1 for s in overall_scores if 0.6 <= s < 0.8)
-    acceptable = sum(1 for s in overall_scores if 0.4 <= s < 0.6)
-    poor = sum(1 for s in overall_scores if s < 0.4)
-
-    # Failure type analysis
-    failure_types = defaultdict(int)
-    for result in enhanced_results:
-        failure_type = result['failure_analysis']['failure_type']
-        if failure_type:
-            failure_types[failure_type] += 1
+    tiers = np.digitize(results['overall'], _TIER_BINS)
+    poor, acceptable, good, excellent = np.bincount(tiers, minlength=4).tolist()
+
+    # Failure type analysis, listed in order of first occurrence
+    failure_codes = results['failure_code']
+    failed_codes = failure_codes[failure_codes != _SUCCESS_CODE]
+    failure_counts = np.bincount(failed_codes, minlength=len(_FAILURE_TYPES))
+    seen_codes, first_seen = np.unique(failed_codes, return_index=True)
+    failure_types = {
+        _FAILURE_TYPES[code]: int(failure_counts[code])
+        for code in seen_codes[np.argsort(first_seen)]
+    }
 
     # Message count statistics
-    message_counts = [r['message_count'] for r in enhanced_results]
+    message_counts = results['msg_count']
 
     return {
-        'total_simulations': len(enhanced_results),
-        'average_execution_score': np.mean(execution_scores),
-        'average_communication_score': np.mean(communication_scores),
-        'average_technical_score': np.mean(technical_scores),
-        'average_efficiency_score': np.mean(efficiency_scores),
-        'average_overall_score': np.mean(overall_scores),
+        'total_simulations': n,
+        'average_execution_score': mean_execution,
+        'average_communication_score': mean_communication,
+        'average_technical_score': mean_technical,
+        'average_efficiency_score': mean_efficiency,
+        'average_overall_score': mean_overall,
         'performance_distribution': {
             'excellent': excellent,
             'good': good,
@@ -228,11 +515,11 @@ def generate_summary_insights(enhanced_results: List[Dict]) -> Dict[str, Any]:
         },
         'failure_type_distribution': dict(failure_types),
         'conversation_stats': {
-            'average_message_count': np.mean(message_counts),
-            'min_message_count': min(message_counts),
-            'max_message_count': max(message_counts)
+            'average_message_count': message_counts.mean(),
+            'min_message_count': int(message_counts.min()),
+            'max_message_count': int(message_counts.max())
         },
-        'success_rate': sum(1 for s in execution_scores if s > 0) / len(execution_scores)
+        'success_rate': np.count_nonzero(results['execution'] > 0) / n
     }
 
 
@@ -252,10 +539,21 @@ def main():
 
     all_results = {}
 
-    for filepath, domain in simulation_files:
+    # Domain files are independent, so analyze them in parallel and report in order.
+    # With a single worker a pool only adds startup cost, so analyze inline instead.
+    max_workers = min(len(simulation_files), os.cpu_count() or 1)
+    if max_workers == 1:
+        pending = [(domain, functools.partial(analyze_simulation_file, filepath))
+                   for filepath, domain in simulation_files]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = [(domain, executor.submit(analyze_simulation_file, filepath).result)
+                       for filepath, domain in simulation_files]
+
+    for domain, get_results in pending:
         print(f'--- {domain.upper()} DOMAIN ANALYSIS ---')
         try:
-            results = analyze_simulation_file(filepath)
+            results = get_results()
             summary = results['summary_insights']
             all_results[domain] = results
 